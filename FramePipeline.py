@@ -0,0 +1,83 @@
+import os
+import threading
+from queue import Queue
+
+import numpy as np
+import proglog
+from moviepy.Clip import Clip
+from moviepy.video.io.ffmpeg_writer import FFMPEG_VideoWriter
+
+
+class FramePipeline:
+    def __init__(self, clip, fps=None, buffers_count=8):
+        self.clip = clip
+        self.fps = fps or getattr(clip, "fps", None)
+        if self.fps is None:
+            raise ValueError("No fps was given to FramePipeline and the clip has no fps attribute. "
+                             "Set clip.fps or pass fps explicitly.")
+        self._frame_step = 1.0 / self.fps
+        self.frames_count = int(np.ceil(clip.duration / self._frame_step))
+        self.buffers = [np.empty((clip.h, clip.w, 3), dtype=np.uint8) for _ in range(buffers_count)]
+        self._free_buffers = None
+        self._ready_buffers = None
+        self._render_error = None
+
+    def write_videofile(self, output_path, codec="libx264", logger="bar"):
+        logger = proglog.default_bar_logger(logger)
+        audiofile = None
+        if self.clip.audio is not None:
+            name = os.path.splitext(os.path.basename(output_path))[0]
+            audiofile = name + Clip._TEMP_FILES_PREFIX + "wvf_snd.mp3"
+            self.clip.audio.write_audiofile(audiofile, fps=44100, nbytes=4, codec="libmp3lame", logger=logger)
+
+        logger(message="Moviepy - Building video %s." % output_path)
+        self._free_buffers = Queue()
+        self._ready_buffers = Queue()
+        for buffer in self.buffers:
+            self._free_buffers.put(buffer)
+        self._render_error = None
+        writer = FFMPEG_VideoWriter(output_path, self.clip.size, self.fps, codec=codec, audiofile=audiofile)
+        render_thread = threading.Thread(target=self._render_frames, daemon=True)
+        render_thread.start()
+        frames_written = 0
+        try:
+            frames_written = self._encode_frames(writer, logger)
+        finally:
+            if frames_written < self.frames_count:
+                self._free_buffers.put(None)
+            render_thread.join()
+            writer.close()
+            if audiofile is not None and os.path.exists(audiofile):
+                os.remove(audiofile)
+        if self._render_error is not None:
+            raise self._render_error
+        logger(message="Moviepy - video ready %s" % output_path)
+
+    def _render_frames(self):
+        try:
+            for index in range(self.frames_count):
+                buffer = self._free_buffers.get()
+                if buffer is None:
+                    return
+                np.copyto(buffer, self.clip.get_frame(index * self._frame_step), casting="unsafe")
+                self._ready_buffers.put(buffer)
+        except Exception as e:
+            self._render_error = e
+        finally:
+            self._ready_buffers.put(None)
+
+    def _encode_frames(self, writer, logger):
+        frames_written = 0
+        for _ in logger.iter_bar(frame_index=range(self.frames_count)):
+            buffer = self._ready_buffers.get()
+            if buffer is None:
+                break
+            try:
+                writer.proc.stdin.write(buffer.data)
+            except IOError as err:
+                _, ffmpeg_error = writer.proc.communicate()
+                raise IOError(str(err) + "\n\nMoviePy error: FFMPEG encountered the following error while "
+                                         "writing file %s:\n\n %s" % (writer.filename, ffmpeg_error.decode()))
+            self._free_buffers.put(buffer)
+            frames_written += 1
+        return frames_written
@@ -2,8 +2,11 @@ import os
 import sys
 import unittest
 
-from moviepy.editor import VideoFileClip
+import numpy as np
+from imageio_ffmpeg import read_frames
+from moviepy.editor import VideoFileClip, ImageClip, VideoClip
 
+from FramePipeline import FramePipeline
 from VideoEditor import VideoEditor
 
 sys.path.append(os.path.abspath(os.path.dirname(__file__)[:-6]))
@@ -38,6 +41,39 @@ class MyTestCase(unittest.TestCase):
         self.editor.save_video(output_path)
         self.assertTrue(os.path.exists(output_path))
 
+    def test_save_video_keeps_size_and_frames(self):
+        output_path = "output.mp4"
+        self.editor.crop_video(100, 100, 200, 200)
+        self.editor.save_video(output_path)
+        saved_video = VideoFileClip(output_path)
+        self.assertEqual(tuple(saved_video.size), tuple(self.editor.video.size))
+        self.assertAlmostEqual(saved_video.duration, self.editor.video.duration, delta=0.1)
+        for t in (0, 2, 5):
+            difference = np.abs(saved_video.get_frame(t).astype(int) - self.editor.video.get_frame(t).astype(int))
+            self.assertLess(difference.mean(), 5)
+
+    def test_frame_pipeline_reuses_buffers(self):
+        fps = 30
+        clip = VideoClip(lambda t: np.full((64, 64, 3), round(t * fps) * 8, dtype=np.uint8), duration=1).set_fps(fps)
+        pipeline = FramePipeline(clip, buffers_count=2)
+        buffers = list(pipeline.buffers)
+        for _ in range(2):
+            pipeline.write_videofile("output.mp4", logger=None)
+            pool = list(pipeline._free_buffers.queue)
+            self.assertEqual(len(pool), 2)
+            self.assertTrue(all(any(buffer is b for b in buffers) for buffer in pool))
+
+            frames = read_frames("output.mp4")
+            next(frames)
+            decoded = [np.frombuffer(frame, dtype=np.uint8) for frame in frames]
+            self.assertEqual(len(decoded), pipeline.frames_count)
+            for index, frame in enumerate(decoded):
+                self.assertLess(np.abs(frame.astype(int) - index * 8).mean(), 2)
+
+    def test_frame_pipeline_requires_fps(self):
+        with self.assertRaises(ValueError):
+            FramePipeline(ImageClip("image.jpg").set_duration(1))
+
     def test_rotate_video(self):
         direction = "right"
         self.editor.rotate_video(direction)
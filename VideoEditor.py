@@ -4,6 +4,8 @@ import moviepy.video.fx.all as vfx
 from json import dumps, loads
 from moviepy.editor import VideoFileClip, concatenate_videoclips, ImageClip, CompositeVideoClip
 
+from FramePipeline import FramePipeline
+
 
 class VideoEditor:
     def __init__(self, file_path):
@@ -52,10 +54,10 @@ class VideoEditor:
         self.video = final
 
     def save_video(self, output_path):
-        self.video.write_videofile(output_path, codec="libx264")
+        FramePipeline(self.video).write_videofile(output_path, codec="libx264")
 
     def save_as(self, path):
-        self.video.write_videofile(path, codec="libx264")
+        FramePipeline(self.video).write_videofile(path, codec="libx264")
 
     def rotate_video(self, direction):
         self._change_undo_redo_stacks()